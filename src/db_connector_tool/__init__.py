@@ -3,14 +3,34 @@
 # SPDX-License-Identifier: MIT
 """数据库连接管理模块 (DB Connector)"""
 
-from .batch_manager import BatchDatabaseManager, cleanup_temp_configs, generate_ip_range
+from typing import TYPE_CHECKING
 
-# 核心模块导入
-from .core.config import ConfigManager
-from .core.connections import DatabaseManager
-from .core.crypto import CryptoManager
-from .core.key_manager import KeyManager
-from .drivers.sqlalchemy_driver import SQLAlchemyDriver
+from ._lazy_import import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .batch_manager import (
+        BatchDatabaseManager,
+        cleanup_temp_configs,
+        generate_ip_range,
+    )
+    from .core.config import ConfigManager
+    from .core.connections import DatabaseManager
+    from .core.crypto import CryptoManager
+    from .core.key_manager import KeyManager
+    from .drivers.sqlalchemy_driver import SQLAlchemyDriver
+
+# 公共API所在的子模块，首次访问时才导入，
+# 只使用 utils 等轻量模块时不必加载 SQLAlchemy 和数据库驱动
+_LAZY_IMPORTS = {
+    "cleanup_temp_configs": ".batch_manager",
+    "generate_ip_range": ".batch_manager",
+    "BatchDatabaseManager": ".batch_manager",
+    "ConfigManager": ".core.config",
+    "CryptoManager": ".core.crypto",
+    "DatabaseManager": ".core.connections",
+    "KeyManager": ".core.key_manager",
+    "SQLAlchemyDriver": ".drivers.sqlalchemy_driver",
+}
 
 # 公共API导出列表
 __all__ = [
@@ -23,3 +43,6 @@ __all__ = [
     "KeyManager",
     "SQLAlchemyDriver",
 ]
+
+
+__getattr__, __dir__ = lazy_module_attrs(globals(), _LAZY_IMPORTS)
@@ -0,0 +1,60 @@
+"""包级按需导入工具 (Lazy Import)
+
+为包的 ``__init__`` 生成 PEP 562 的模块级 ``__getattr__`` 和 ``__dir__``，
+公共API在首次访问时才导入对应子模块，只使用轻量模块时不必加载
+SQLAlchemy 和数据库驱动。
+
+Example:
+>>> _LAZY_IMPORTS = {"DatabaseManager": ".connections"}
+>>> __getattr__, __dir__ = lazy_module_attrs(globals(), _LAZY_IMPORTS)
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+
+def lazy_module_attrs(
+    module_globals: Dict[str, Any], lazy_imports: Mapping[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """生成按需导入公共API的模块级 ``__getattr__`` 和 ``__dir__``
+
+    Args:
+        module_globals: 包模块的 ``globals()``，导入后的对象缓存到这里，
+            之后的访问不再经过 ``__getattr__``
+        lazy_imports: 公共API名称到所在子模块（相对于该包）的映射
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+        ``(__getattr__, __dir__)``
+    """
+    package = module_globals["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        """按需导入公共API（PEP 562）
+
+        Args:
+            name: 属性名称
+
+        Returns:
+            Any: 对应子模块中的对象，导入后缓存到模块命名空间
+
+        Raises:
+            AttributeError: 当属性不属于公共API时
+        """
+        module_name = lazy_imports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module_name, package), name)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        """列出模块属性，包含尚未导入的公共API（PEP 562）
+
+        Returns:
+            List[str]: 已加载的属性与 ``__all__`` 的并集，按名称排序
+        """
+        return sorted(set(module_globals) | set(module_globals.get("__all__", ())))
+
+    return __getattr__, __dir__
@@ -1,7 +1,9 @@
 """数据库连接器核心模块 (Core)"""
 
+from typing import TYPE_CHECKING
+
+from .._lazy_import import lazy_module_attrs
 from .config import ConfigManager
-from .connections import DatabaseManager
 from .crypto import CryptoManager
 from .exceptions import (
     ConfigError,
@@ -17,6 +19,14 @@ from .exceptions import (
 )
 from .key_manager import KeyManager
 
+if TYPE_CHECKING:
+    from .connections import DatabaseManager
+
+# 首次访问时才导入的公共API，导入配置和异常时不加载 SQLAlchemy
+_LAZY_IMPORTS = {
+    "DatabaseManager": ".connections",
+}
+
 # 公共API导出列表
 __all__ = [
     "ConfigManager",
@@ -34,3 +44,6 @@ __all__ = [
     "QueryError",
     "ValidationError",
 ]
+
+
+__getattr__, __dir__ = lazy_module_attrs(globals(), _LAZY_IMPORTS)
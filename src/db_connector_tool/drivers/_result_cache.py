@@ -0,0 +1,69 @@
+"""查询结果缓存模块 (Query Result Cache)
+
+为 :class:`SQLAlchemyDriver` 的 ``execute_query`` 提供带过期时间的
+线程安全 LRU 结果缓存。
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+
+class _QueryResultCache:
+    """带过期时间的查询结果 LRU 缓存（内部类）
+
+    以 (SQL, 参数) 为键缓存 execute_query 的结果，条目超过 ``ttl`` 秒
+    即视为过期，数量超过 ``maxsize`` 时淘汰最久未使用的条目。线程安全。
+    """
+
+    __slots__ = ("_maxsize", "_ttl", "_entries", "_lock")
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[float, List[Any]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[List[Any]]:
+        """读取未过期的缓存结果，不存在或已过期时返回 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, rows = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return rows
+
+    def set(self, key: Tuple[Any, ...], rows: List[Any]) -> None:
+        """写入缓存结果，超出容量时淘汰最久未使用的条目"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, rows)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, pattern: Optional[str] = None) -> int:
+        """删除SQL中包含 ``pattern`` 的条目，pattern 为 None 时清空缓存
+
+        Returns:
+            int: 删除的条目数量
+        """
+        with self._lock:
+            if pattern is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+
+            keys = [key for key in self._entries if pattern in key[0]]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+
+# pylint: disable=unused-argument
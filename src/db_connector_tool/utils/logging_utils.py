@@ -21,13 +21,17 @@ Example:
 >>> module_logger.debug("模块初始化完成")
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import stat
 import sys
 import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from .path_utils import PathHelper
 
@@ -36,7 +40,9 @@ DEFAULT_LOG_FORMAT = (
     + "[%(filename)s:%(lineno)d]"
 )
 
-VALID_LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+# Formatter 不保存记录相关的状态，默认格式的各个 handler 共用同一个实例
+_DEFAULT_FORMATTER = logging.Formatter(DEFAULT_LOG_FORMAT)
+
 LOG_LEVEL_MAP = {
     "DEBUG": logging.DEBUG,
     "INFO": logging.INFO,
@@ -44,6 +50,121 @@ LOG_LEVEL_MAP = {
     "ERROR": logging.ERROR,
     "CRITICAL": logging.CRITICAL,
 }
+VALID_LOG_LEVELS = frozenset(LOG_LEVEL_MAP)
+
+# 启用 async_logging 的 logger 名称 → 后台写日志的 QueueListener
+_QUEUE_LISTENERS: Dict[str, logging.handlers.QueueListener] = {}
+_QUEUE_LISTENERS_LOCK = threading.Lock()
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """带写缓冲的按大小轮转文件 handler
+
+    ``buffer_size`` 大于 0 时日志文件以指定大小的缓冲区打开，低于 WARNING
+    的记录不再逐条 flush，而是在距上次 flush 超过 ``flush_interval`` 秒、
+    遇到 WARNING 及以上级别的记录、轮转或关闭时才写入磁盘，
+    把多次小的 write 系统调用合并为一次。有记录被延迟时会启动一个
+    ``flush_interval`` 秒后触发的后台定时器，进程空闲、没有新记录时
+    缓冲区中的记录也会按时写出。``buffer_size`` 为 0 时
+    行为与 RotatingFileHandler 相同。
+
+    日志文件是否为普通文件只在打开时用 fstat 判断一次，轮转检查不再
+    对每条记录调用 os.path.exists/isfile，也不再为预估大小额外格式化一次
+    记录：只比较已写入文件的字节数，因此轮转后的文件可能比 ``maxBytes``
+    多出最后一条记录（缓冲模式下再加上缓冲区中的内容）。同一次 fstat
+    还记录打开时文件是否为空（``_was_newly_created``），供 setup_logging
+    判断是否输出初始化日志。
+
+    Example:
+    >>> handler = BufferedRotatingFileHandler("app.log", buffer_size=8192)
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        *args: Any,
+        buffer_size: int = 0,
+        flush_interval: float = 1.0,
+        **kwargs: Any,
+    ) -> None:
+        """初始化 handler
+
+        Args:
+            filename: 日志文件路径
+            *args: 传递给 RotatingFileHandler 的位置参数
+            buffer_size: 写缓冲区大小（字节），0 表示每条记录立即写入
+            flush_interval: 缓冲模式下记录在缓冲区中停留的最长时间（秒）
+            **kwargs: 传递给 RotatingFileHandler 的关键字参数
+        """
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._defer_flush = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._is_regular_file = True
+        self._was_newly_created = True
+        super().__init__(filename, *args, **kwargs)
+
+    def _open(self) -> Any:
+        if self.buffer_size <= 0:
+            stream = super()._open()
+        else:
+            stream = open(  # pylint: disable=consider-using-with
+                self.baseFilename,
+                self.mode,
+                buffering=self.buffer_size,
+                encoding=self.encoding,
+                errors=self.errors,
+            )
+        file_stat = os.fstat(stream.fileno())
+        self._is_regular_file = stat.S_ISREG(file_stat.st_mode)
+        self._was_newly_created = file_stat.st_size == 0
+        return stream
+
+    def shouldRollover(self, record: logging.LogRecord) -> int:
+        if self.stream is None:
+            self.stream = self._open()
+        # 与标准库一致，只轮转普通文件（/dev/null 等设备文件不轮转）
+        if self.maxBytes <= 0 or not self._is_regular_file:
+            return False
+        # 文本流的 seek/tell 会先 flush 缓冲区，这里直接读取底层文件位置
+        return self.stream.buffer.raw.tell() >= self.maxBytes
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._defer_flush = (
+            self.buffer_size > 0
+            and record.levelno < logging.WARNING
+            and time.monotonic() - self._last_flush < self.flush_interval
+        )
+        try:
+            super().emit(record)
+            if self._defer_flush and self._flush_timer is None:
+                # 保证空闲时缓冲区中的记录最迟 flush_interval 秒后写出
+                self._flush_timer = threading.Timer(
+                    self.flush_interval, self._flush_on_timer
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        finally:
+            self._defer_flush = False
+
+    def _flush_on_timer(self) -> None:
+        with self.lock:
+            self._flush_timer = None
+            self.flush()
+
+    def flush(self) -> None:
+        if self._defer_flush:
+            return
+        super().flush()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        super().close()
 
 
 def setup_logging(**kwargs) -> logging.Logger:
@@ -59,6 +180,12 @@ def setup_logging(**kwargs) -> logging.Logger:
         log_format: 自定义格式字符串，None 使用默认
         log_dir: 自定义日志目录，None 使用默认配置目录
         separate_error_log: 是否分离错误日志，默认 True
+        buffer_size: 主日志文件的写缓冲区大小（字节），默认 0 表示逐条写入，
+            参见 :class:`BufferedRotatingFileHandler`
+        async_logging: 是否由后台线程写日志，默认 False。启用后调用方只需
+            把日志记录放入内存队列，文件写入和轮转在 QueueListener 线程中完成
+        queue_maxsize: 异步日志队列的最大长度，默认 0 表示不限制；
+            大于 0 时队列已满的记录会被直接丢弃，调用方永不阻塞
 
     Returns:
         logging.Logger: 配置好的 logger 实例
@@ -82,6 +209,9 @@ def setup_logging(**kwargs) -> logging.Logger:
         "log_format": None,
         "log_dir": None,
         "separate_error_log": True,
+        "buffer_size": 0,
+        "async_logging": False,
+        "queue_maxsize": 0,
     }
 
     config = {**default_config, **kwargs}
@@ -104,7 +234,6 @@ def _setup_logging_from_config(config: dict) -> logging.Logger:
     PathHelper.ensure_dir_exists(log_dir_path)
 
     log_file = log_dir_path / f"{config['app_name']}.log"
-    log_file_exists = os.path.exists(log_file)
 
     formatter = _create_formatter(config["log_format"])
     logger = _setup_logger(config["app_name"], log_level)
@@ -121,13 +250,23 @@ def _setup_logging_from_config(config: dict) -> logging.Logger:
         "separate_error_log": config["separate_error_log"],
         "max_file_size": config["max_file_size"],
         "backup_count": config["backup_count"],
+        "buffer_size": config["buffer_size"],
     }
 
     handlers_added = _configure_handlers_from_config(handler_config)
 
     if handlers_added == 0:
         raise ValueError("至少需要启用一种日志输出方式（控制台或文件）")
-    if not log_file_exists:
+    # 文件 handler 打开时已经记录了日志文件是否为新文件，无需再 stat 一次
+    log_file_path = os.path.abspath(log_file)
+    log_file_is_new = all(
+        getattr(handler, "_was_newly_created", True)
+        for handler in logger.handlers
+        if getattr(handler, "baseFilename", None) == log_file_path
+    )
+    if config["async_logging"]:
+        _enable_queue_logging(logger, config["queue_maxsize"])
+    if log_file_is_new:
         logger.info(
             "日志系统初始化完成 - 应用: %s, 级别: %s, 日志文件: %s",
             config["app_name"],
@@ -153,10 +292,12 @@ def _validate_log_level(level: str) -> int:
     Example:
     >>> _validate_log_level("debug")  # 返回 logging.DEBUG
     """
-    level_upper = level.upper()
-    if level_upper not in VALID_LOG_LEVELS:
-        raise ValueError(f"无效的日志级别: '{level}'，有效值为: {VALID_LOG_LEVELS}")
-    return LOG_LEVEL_MAP[level_upper]
+    log_level = LOG_LEVEL_MAP.get(level.upper())
+    if log_level is None:
+        raise ValueError(
+            f"无效的日志级别: '{level}'，有效值为: {', '.join(LOG_LEVEL_MAP)}"
+        )
+    return log_level
 
 
 def _get_log_dir_path(app_name: str, log_dir: str | None) -> Path:
@@ -182,10 +323,11 @@ def _create_formatter(log_format: str | None) -> logging.Formatter:
         log_format: 自定义格式，None 使用默认
 
     Returns:
-        logging.Formatter: 格式化器实例
+        logging.Formatter: 格式化器实例，默认格式返回模块级共享实例
     """
-    format_to_use = log_format if log_format is not None else DEFAULT_LOG_FORMAT
-    return logging.Formatter(format_to_use)
+    if log_format is None:
+        return _DEFAULT_FORMATTER
+    return logging.Formatter(log_format)
 
 
 def _setup_logger(app_name: str, log_level: int) -> logging.Logger:
@@ -201,6 +343,7 @@ def _setup_logger(app_name: str, log_level: int) -> logging.Logger:
     logger = logging.getLogger(app_name)
     logger.setLevel(log_level)
 
+    _stop_queue_listener(app_name)
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
         handler.close()
@@ -208,6 +351,95 @@ def _setup_logger(app_name: str, log_level: int) -> logging.Logger:
     return logger
 
 
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """有界队列已满时直接丢弃记录的 QueueHandler"""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+class _BoundedQueueListener(logging.handlers.QueueListener):
+    """配合有界队列使用的 QueueListener
+
+    标准库用 put_nowait 放入结束标记，队列已满时会抛出 queue.Full，
+    监听线程不会退出。这里在监听线程存活期间等待队列腾出空间后再放入，
+    线程已经退出时无需结束标记。
+    """
+
+    def enqueue_sentinel(self) -> None:
+        while True:
+            try:
+                self.queue.put(self._sentinel, timeout=0.05)
+                return
+            except queue.Full:
+                thread = self._thread
+                if thread is None or not thread.is_alive():
+                    return
+
+
+def _enable_queue_logging(logger: logging.Logger, maxsize: int = 0) -> None:
+    """将 logger 的 handlers 移到后台 QueueListener 中
+
+    logger 上只保留一个 QueueHandler，记录入队后由监听线程交给原 handlers
+    处理，并按各 handler 自身的级别过滤。进程退出时自动停止监听线程，
+    确保队列中剩余的记录全部写出。
+
+    Args:
+        logger: 已注册好 handlers 的 logger 实例
+        maxsize: 队列最大长度，0 表示不限制；有界队列满时丢弃新记录
+    """
+    handlers = logger.handlers[:]
+    for handler in handlers:
+        logger.removeHandler(handler)
+
+    queue_handler: logging.handlers.QueueHandler
+    listener_class: type[logging.handlers.QueueListener]
+    if maxsize > 0:
+        log_queue: Any = queue.Queue(maxsize)
+        queue_handler = _DroppingQueueHandler(log_queue)
+        listener_class = _BoundedQueueListener
+    else:
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        listener_class = logging.handlers.QueueListener
+
+    listener = listener_class(log_queue, *handlers, respect_handler_level=True)
+    logger.addHandler(queue_handler)
+
+    with _QUEUE_LISTENERS_LOCK:
+        _QUEUE_LISTENERS[logger.name] = listener
+    listener.start()
+    atexit.register(listener.stop)
+
+
+def _stop_queue_listener(logger_name: str) -> None:
+    """停止并关闭指定 logger 的 QueueListener 及其 handlers
+
+    停止前队列中的记录会全部写出，随后移除 logger 上对应的 QueueHandler。
+
+    Args:
+        logger_name: logger 名称
+    """
+    with _QUEUE_LISTENERS_LOCK:
+        listener = _QUEUE_LISTENERS.pop(logger_name, None)
+    if listener is None:
+        return
+
+    listener.stop()
+    atexit.unregister(listener.stop)
+    for handler in listener.handlers:
+        handler.close()
+
+    logger = logging.getLogger(logger_name)
+    for handler in logger.handlers[:]:
+        if getattr(handler, "queue", None) is listener.queue:
+            logger.removeHandler(handler)
+            handler.close()
+
+
 def _configure_handlers_from_config(config: dict) -> int:
     """按配置注册所有 handlers
 
@@ -242,11 +474,12 @@ def _configure_handlers_from_config(config: dict) -> int:
             "separate_error_log": separate_error_log,
             "max_file_size": max_file_size,
             "backup_count": backup_count,
+            "buffer_size": config["buffer_size"],
         }
         handlers_added += _configure_file_handlers_from_config(file_handler_config)
 
     if log_to_console:
-        handlers_added += _configure_console_handler(logger, formatter, log_level)
+        handlers_added += _configure_console_handler(logger, formatter)
 
     return handlers_added
 
@@ -277,14 +510,14 @@ def _configure_file_handlers_from_config(config: dict) -> int:
     try:
         handlers_added = 0
 
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             filename=str(log_file),
             maxBytes=max_file_size,
             backupCount=backup_count,
             encoding="utf-8",
+            buffer_size=config["buffer_size"],
         )
         file_handler.setFormatter(formatter)
-        file_handler.setLevel(log_level)
         logger.addHandler(file_handler)
         handlers_added += 1
 
@@ -327,7 +560,7 @@ def _create_error_file_handler(**kwargs) -> logging.Handler:
     backup_count = kwargs["backup_count"]
 
     error_log_file = log_dir_path / f"{app_name}_error.log"
-    error_handler = logging.handlers.RotatingFileHandler(
+    error_handler = BufferedRotatingFileHandler(
         filename=str(error_log_file),
         maxBytes=max_file_size,
         backupCount=backup_count,
@@ -339,21 +572,21 @@ def _create_error_file_handler(**kwargs) -> logging.Handler:
 
 
 def _configure_console_handler(
-    logger: logging.Logger, formatter: logging.Formatter, log_level: int
+    logger: logging.Logger, formatter: logging.Formatter
 ) -> int:
     """配置控制台 handler
 
+    handler 保持 NOTSET 级别，只由 logger 的级别过滤记录。
+
     Args:
         logger: logger 实例
         formatter: 格式化器
-        log_level: 日志级别常量
 
     Returns:
         int: 添加的 handler 数量（始终为 1）
     """
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    console_handler.setLevel(log_level)
     logger.addHandler(console_handler)
     return 1
 
@@ -391,8 +624,14 @@ def set_log_level(logger_name: str, level: str) -> None:
     logger = get_logger(logger_name)
     logger.setLevel(log_level)
 
-    for handler in logger.handlers:
-        handler.setLevel(log_level)
+    handlers = list(logger.handlers)
+    listener = _QUEUE_LISTENERS.get(logger_name)
+    if listener is not None:
+        handlers.extend(listener.handlers)
+
+    # 级别已经校验过，直接赋值，跳过 setLevel 中的 _checkLevel
+    for handler in handlers:
+        handler.level = log_level
 
 
 class LogManager:
@@ -448,6 +687,7 @@ class LogManager:
             backup_count: 备份数量，默认 5
             level: 日志级别（可选）
             when: 时间轮转规则（'midnight', 'H', 'D' 等）
+            buffer_size: 按大小轮转时的写缓冲区大小（字节），默认 0 表示逐条写入
 
         Raises:
             ValueError: 日志级别无效
@@ -464,8 +704,6 @@ class LogManager:
         when = kwargs.get("when")
 
         with self._lock:
-            formatter = logging.Formatter(DEFAULT_LOG_FORMAT)
-
             if when is not None:
                 file_handler = logging.handlers.TimedRotatingFileHandler(
                     filename=log_file,
@@ -474,14 +712,15 @@ class LogManager:
                     encoding="utf-8",
                 )
             else:
-                file_handler = logging.handlers.RotatingFileHandler(
+                file_handler = BufferedRotatingFileHandler(
                     filename=log_file,
                     maxBytes=max_size,
                     backupCount=backup_count,
                     encoding="utf-8",
+                    buffer_size=kwargs.get("buffer_size", 0),
                 )
 
-            file_handler.setFormatter(formatter)
+            file_handler.setFormatter(_DEFAULT_FORMATTER)
 
             if level is not None:
                 handler_level = _validate_log_level(level)
@@ -515,10 +754,14 @@ class LogManager:
     def cleanup(self) -> None:
         """清理所有 LogManager 创建的 handler
 
+        启用了 ``async_logging`` 时会先停止后台监听线程，
+        确保队列中尚未写出的日志全部落盘。
+
         Example:
         >>> log_manager.cleanup()
         """
         with self._lock:
+            _stop_queue_listener(self.app_name)
             logger = logging.getLogger(self.app_name)
             handler_count = len(self._handlers)
 
@@ -532,6 +775,9 @@ class LogManager:
     def get_loggers_info(self) -> Dict[str, Dict[str, Any]]:
         """获取系统中所有 logger 的配置信息
 
+        直接读取 logging 管理器中已创建的 logger，不会为占位节点
+        （只作为其他 logger 父级出现的名称）创建新的 logger。
+
         Returns:
             Dict[str, Dict[str, Any]]: logger 名 → {level, handlers, propagate}
 
@@ -539,19 +785,16 @@ class LogManager:
         >>> info = log_manager.get_loggers_info()
         >>> print(info["db_connector_tool.core"])
         """
-        with self._lock:
-            loggers_info: Dict[str, Dict[str, Any]] = {}
-            manager = logging.getLogger().manager
-
-            for name in manager.loggerDict:
-                logger = logging.getLogger(name)
-                loggers_info[name] = {
-                    "level": logging.getLevelName(logger.level),
-                    "handlers": len(logger.handlers),
-                    "propagate": logger.propagate,
-                }
-
-            return loggers_info
+        entries = list(logging.getLogger().manager.loggerDict.items())
+        return {
+            name: {
+                "level": logging.getLevelName(logger.level),
+                "handlers": len(logger.handlers),
+                "propagate": logger.propagate,
+            }
+            for name, logger in entries
+            if isinstance(logger, logging.Logger)
+        }
 
     @staticmethod
     def quick_setup(app_name: str, level: str = "INFO") -> "LogManager":
@@ -23,9 +23,11 @@ True
 
 import getpass
 import os
-import platform
+import re
 import stat
 import subprocess
+import sys
+from functools import lru_cache
 from pathlib import Path
 
 _ERROR_MSG_PATH_EMPTY = "路径不能为空"
@@ -36,6 +38,69 @@ _ERROR_MSG_APP_NAME_EMPTY = "应用名称不能为空且必须是字符串"
 _ERROR_MSG_EXTENSIONS_EMPTY = "扩展名列表不能为空"
 _ERROR_MSG_FILE_TYPE_EMPTY = "文件类型不能为空"
 
+# 运行平台在进程生命周期内不变，导入时判断一次
+_IS_WINDOWS = sys.platform == "win32"
+_IS_DARWIN = sys.platform == "darwin"
+
+# 路径中的非法字符，预编译为字符类，一次扫描即可完成检查
+_WINDOWS_ILLEGAL_PATH_RE = re.compile('[<>"|?*:\0\n\r\t\b\f]')
+_UNIX_ILLEGAL_PATH_RE = re.compile("[\0?*]")
+# safe_join 的路径部分不允许出现分隔符，与非法字符合并为一个字符类
+_PATH_SEPARATORS = "/\\"
+_WINDOWS_FORBIDDEN_PART_RE = re.compile('[<>"|?*:\0\n\r\t\b\f/\\\\]')
+_UNIX_FORBIDDEN_PART_RE = re.compile("[\0?*/\\\\]")
+
+
+@lru_cache(maxsize=1024)
+def _resolve_absolute_path(path_str: str) -> Path:
+    """解析绝对路径并缓存结果（内部函数）
+
+    只缓存绝对路径，结果与当前工作目录无关。缓存期间符号链接被修改时
+    结果可能过期，可通过 PathHelper.clear_path_cache 清空。
+
+    Args:
+        path_str: 绝对路径字符串
+
+    Returns:
+        Path: 解析符号链接后的路径
+    """
+    return Path(path_str).resolve()
+
+
+def _resolve_path(path: Path) -> Path:
+    """解析路径，绝对路径走缓存，相对路径每次实时解析（内部函数）
+
+    Args:
+        path: 需要解析的路径
+
+    Returns:
+        Path: 解析后的绝对路径
+    """
+    if path.is_absolute():
+        return _resolve_absolute_path(str(path))
+    return path.resolve()
+
+
+def _ensure_dir(path: Path) -> bool:
+    """确保目录存在，已存在时只需一次 stat 调用
+
+    Args:
+        path: 目标目录路径
+
+    Returns:
+        bool: 目录是否已存在或成功创建（路径被非目录文件占用时返回 False）
+
+    Raises:
+        OSError: 目录创建失败（权限不足等）
+    """
+    if path.is_dir():
+        return True
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    except FileExistsError:
+        return False
+    return True
+
 
 class PathHelper:
     """路径辅助类 (Path Helper)
@@ -71,12 +136,7 @@ class PathHelper:
 
         try:
             dir_path_obj = Path(dir_path) if isinstance(dir_path, str) else dir_path
-
-            if dir_path_obj.exists():
-                return dir_path_obj.is_dir()
-
-            dir_path_obj.mkdir(parents=True, exist_ok=True)
-            return True
+            return _ensure_dir(dir_path_obj)
 
         except OSError as error:
             raise OSError(f"无法创建目录 '{dir_path}': {error}") from error
@@ -108,8 +168,7 @@ class PathHelper:
             if not path_str.strip():
                 return False
 
-            system = platform.system().lower()
-            if system == "windows":
+            if _IS_WINDOWS:
                 return PathHelper._is_valid_path_windows(path_str)
             return PathHelper._is_valid_path_unix(path_str)
 
@@ -126,27 +185,12 @@ class PathHelper:
         Returns:
             bool: 路径是否有效
         """
-        if ":" in path_str and path_str.index(":") == 1 and path_str[0].isalpha():
-            check_str = path_str[2:] if len(path_str) > 2 else ""
+        if len(path_str) >= 2 and path_str[1] == ":" and path_str[0].isalpha():
+            check_str = path_str[2:]
         else:
             check_str = path_str
 
-        illegal_chars = [
-            "<",
-            ">",
-            '"',
-            "|",
-            "?",
-            "*",
-            ":",
-            "\0",
-            "\n",
-            "\r",
-            "\t",
-            "\b",
-            "\f",
-        ]
-        return not any(char in check_str for char in illegal_chars)
+        return _WINDOWS_ILLEGAL_PATH_RE.search(check_str) is None
 
     @staticmethod
     def _is_valid_path_unix(path_str: str) -> bool:
@@ -158,18 +202,24 @@ class PathHelper:
         Returns:
             bool: 路径是否有效
         """
-        illegal_chars = ["\0", "?", "*"]
-        return not any(char in path_str for char in illegal_chars)
+        return _UNIX_ILLEGAL_PATH_RE.search(path_str) is None
 
     @staticmethod
     def get_absolute_path(
-        relative_path: str | Path, base_dir: str | Path | None = None
+        relative_path: str | Path,
+        base_dir: str | Path | None = None,
+        resolve_symlinks: bool = False,
     ) -> Path:
         """获取相对路径的绝对路径
 
+        默认只用 os.path.abspath 做字符串层面的拼接和规范化，不访问文件系统；
+        需要解析符号链接时传入 ``resolve_symlinks=True``，此时会对路径中的
+        每一级调用 lstat。
+
         Args:
             relative_path: 相对路径
             base_dir: 基准目录，None 则使用当前工作目录
+            resolve_symlinks: 是否解析符号链接，默认 False
 
         Returns:
             Path: 绝对路径
@@ -191,8 +241,12 @@ class PathHelper:
             Path(relative_path) if isinstance(relative_path, str) else relative_path
         )
 
+        joined_path = base_path / relative_path_obj
+        if not resolve_symlinks:
+            return Path(os.path.abspath(joined_path))
+
         try:
-            return (base_path / relative_path_obj).resolve()
+            return joined_path.resolve()
         except OSError as error:
             raise OSError(f"无法解析路径 '{relative_path}': {error}") from error
 
@@ -200,6 +254,12 @@ class PathHelper:
     def get_user_config_dir(app_name: str) -> Path:
         """获取用户配置目录路径
 
+        目录已存在时只需一次 stat 调用即可返回，不存在时才递归创建。
+        不缓存结果，目录在进程运行期间被删除后下次调用会重新创建。
+        Linux 等系统优先使用 ``XDG_CONFIG_HOME`` 环境变量指定的目录；
+        若该目录下还没有应用配置而旧位置 ``~/.config/<app_name>`` 已存在，
+        则继续使用旧目录，避免设置环境变量后已有配置被“丢失”。
+
         Args:
             app_name: 应用名称
 
@@ -220,18 +280,24 @@ class PathHelper:
         if not app_name or not isinstance(app_name, str):
             raise ValueError(_ERROR_MSG_APP_NAME_EMPTY)
 
-        system = platform.system().lower()
-
         try:
-            if system == "windows":
-                base_dir = Path(os.environ.get("APPDATA", Path.home()))
-            elif system == "darwin":
+            if _IS_WINDOWS:
+                base_dir = Path(os.environ.get("APPDATA") or Path.home())
+            elif _IS_DARWIN:
                 base_dir = Path.home() / "Library" / "Application Support"
             else:
-                base_dir = Path.home() / ".config"
+                legacy_base_dir = Path.home() / ".config"
+                base_dir = Path(os.environ.get("XDG_CONFIG_HOME") or legacy_base_dir)
+                if (
+                    base_dir != legacy_base_dir
+                    and not (base_dir / app_name).exists()
+                    and (legacy_base_dir / app_name).is_dir()
+                ):
+                    base_dir = legacy_base_dir
 
             config_dir = base_dir / app_name
-            config_dir.mkdir(parents=True, exist_ok=True)
+            if not _ensure_dir(config_dir):
+                raise NotADirectoryError(f"配置路径不是目录: {config_dir}")
 
             return config_dir
 
@@ -261,6 +327,9 @@ class PathHelper:
     def normalize_path(path: str | Path) -> Path:
         """规范化路径
 
+        绝对路径（含 ``~`` 展开后）的解析结果会被缓存，重复规范化同一路径时
+        不再逐级 lstat。
+
         Args:
             path: 路径字符串或 Path 对象
 
@@ -281,12 +350,23 @@ class PathHelper:
 
         try:
             path_obj = Path(path) if isinstance(path, str) else path
-            return path_obj.expanduser().resolve()
+            return _resolve_path(path_obj.expanduser())
         except OSError as error:
             raise OSError(f"无法解析路径 '{path}': {error}") from error
         except (TypeError, ValueError) as error:
             raise ValueError(f"无效的路径格式 '{path}': {error}") from error
 
+    @staticmethod
+    def clear_path_cache() -> None:
+        """清空 normalize_path 和 safe_join 使用的路径解析缓存
+
+        符号链接在进程运行期间被修改后调用，使后续解析重新访问文件系统。
+
+        Example:
+        >>> PathHelper.clear_path_cache()
+        """
+        _resolve_absolute_path.cache_clear()
+
     @staticmethod
     def rename_if_exists(file_path: str | Path) -> Path:
         """文件存在时自动重命名
@@ -325,6 +405,9 @@ class PathHelper:
     def safe_join(base_path: str | Path, *paths: str) -> Path:
         """安全连接路径，防止路径遍历攻击
 
+        基础路径为绝对路径时其解析结果会被缓存（见 clear_path_cache），
+        连接后的最终路径每次都实时解析后再做越界检查。
+
         Args:
             base_path: 基础路径
             *paths: 要连接的路径部分
@@ -344,8 +427,12 @@ class PathHelper:
             raise ValueError(_ERROR_MSG_BASE_PATH_EMPTY)
 
         base_path_obj = Path(base_path) if isinstance(base_path, str) else base_path
-        base_path_resolved = base_path_obj.resolve()
-        result_path = base_path_resolved
+        base_path_resolved = _resolve_path(base_path_obj)
+        parts: list[str] = []
+        # 平台判断只做一次，每个部分只扫描一遍即可同时检查非法字符和分隔符
+        forbidden_part_re = (
+            _WINDOWS_FORBIDDEN_PART_RE if _IS_WINDOWS else _UNIX_FORBIDDEN_PART_RE
+        )
 
         for path_part in paths:
             if not path_part or path_part == ".":
@@ -354,13 +441,23 @@ class PathHelper:
             if path_part == "..":
                 raise ValueError("路径遍历不被允许")
 
-            if not PathHelper.is_valid_path(path_part):
+            if not path_part.strip():
+                raise ValueError(f"路径部分包含非法字符: {path_part}")
+
+            forbidden = forbidden_part_re.search(path_part)
+            if forbidden is not None:
+                if forbidden.group() in _PATH_SEPARATORS:
+                    raise ValueError(f"路径部分包含路径分隔符: {path_part}")
                 raise ValueError(f"路径部分包含非法字符: {path_part}")
 
-            if "/" in path_part or "\\" in path_part:
-                raise ValueError(f"路径部分包含路径分隔符: {path_part}")
+            parts.append(path_part)
 
-            result_path = result_path / path_part
+        # 没有需要连接的部分时结果就是已解析的基础路径，无需再次解析和越界检查
+        if not parts:
+            return base_path_resolved
+
+        # 校验完成后一次性拼接，避免每个部分都构造一个中间 Path 对象
+        result_path = base_path_resolved.joinpath(*parts)
 
         try:
             resolved_result = result_path.resolve()
@@ -554,9 +651,7 @@ class PathHelper:
         if not file_path_obj.exists():
             raise OSError(f"文件不存在: {file_path_obj}")
 
-        system = platform.system().lower()
-
-        if system == "windows":
+        if _IS_WINDOWS:
             return PathHelper._set_windows_file_permissions(file_path_obj)
         return PathHelper._set_unix_file_permissions(file_path_obj)
 
@@ -3,6 +3,8 @@
 测试系统各组件之间的协作，确保整个系统能够正常工作。
 """
 
+import subprocess
+import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -135,6 +137,28 @@ class TestIntegration(TestCase):
         self.assertTrue(PasswordValidator.validate_strength(strong_password))
         self.assertFalse(PasswordValidator.validate_strength(weak_password))
 
+    def test_utils_import_does_not_load_sqlalchemy(self):
+        """测试只导入工具模块时不加载 SQLAlchemy"""
+        code = (
+            "import sys\n"
+            "import src.db_connector_tool.utils.path_utils\n"
+            "import src.db_connector_tool.core.exceptions\n"
+            "assert 'sqlalchemy' not in sys.modules\n"
+            "import src.db_connector_tool as package\n"
+            "assert package.SQLAlchemyDriver.__name__ == 'SQLAlchemyDriver'\n"
+            "import src.db_connector_tool.core as core\n"
+            "assert 'DatabaseManager' in dir(core)\n"
+            "assert core.DatabaseManager is vars(core)['DatabaseManager']\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,9 @@
 import logging
+import logging.handlers
 import os
 import shutil
 import tempfile
+import time
 import unittest
 from pathlib import Path
 
@@ -9,6 +11,7 @@ from src.db_connector_tool.utils.logging_utils import (
     LOG_LEVEL_MAP,
     VALID_LOG_LEVELS,
     LogManager,
+    _stop_queue_listener,
     _validate_log_level,
     get_logger,
     set_log_level,
@@ -67,6 +70,8 @@ class TestLoggingUtils(unittest.TestCase):
             log_to_file=False,
         )
         self.assertEqual(logger2.level, logging.INFO)
+        # handler 不单独设置级别，由 logger 统一过滤
+        self.assertTrue(all(h.level == logging.NOTSET for h in logger2.handlers))
 
         # 测试错误：未启用任何输出方式
         with self.assertRaises(ValueError):
@@ -76,6 +81,23 @@ class TestLoggingUtils(unittest.TestCase):
                 log_to_file=False,
             )
 
+    def test_setup_logging_banner_only_for_new_log_file(self):
+        """测试只在日志文件为新文件时输出初始化日志"""
+        app_name = self.app_name + "_banner"
+        log_file = Path(self.temp_dir) / f"{app_name}.log"
+        for _ in range(2):
+            logger = setup_logging(
+                app_name=app_name,
+                log_to_console=False,
+                log_to_file=True,
+                log_dir=self.temp_dir,
+            )
+            for handler in logger.handlers:
+                handler.flush()
+
+        content = log_file.read_text(encoding="utf-8")
+        self.assertEqual(content.count("日志系统初始化完成"), 1)
+
     def test_setup_logging_with_separate_error_log(self):
         """测试单独的错误日志配置"""
         # 测试启用单独错误日志且级别为ERROR或更低
@@ -147,6 +169,187 @@ class TestLoggingUtils(unittest.TestCase):
         # 验证文件创建
         self.assertTrue(os.path.exists(test_log_file))
 
+    def test_default_formatter_shared(self):
+        """测试默认格式的 handler 共用同一个格式化器"""
+        logger = setup_logging(
+            app_name=self.app_name + "_formatter",
+            log_dir=self.temp_dir,
+            separate_error_log=True,
+        )
+        formatters = {id(handler.formatter) for handler in logger.handlers}
+        self.assertEqual(len(formatters), 1)
+
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
+    def test_setup_logging_async(self):
+        """测试异步日志只在 logger 上挂载 QueueHandler，停止后记录全部写出"""
+        app_name = self.app_name + "_async"
+        logger = setup_logging(
+            app_name=app_name,
+            log_dir=self.temp_dir,
+            separate_error_log=False,
+            async_logging=True,
+        )
+        self.assertEqual(len(logger.handlers), 1)
+        self.assertIsInstance(logger.handlers[0], logging.handlers.QueueHandler)
+
+        logger.warning("异步日志消息")
+        _stop_queue_listener(app_name)
+        self.assertEqual(logger.handlers, [])
+
+        log_file = Path(self.temp_dir) / f"{app_name}.log"
+        self.assertIn("异步日志消息", log_file.read_text(encoding="utf-8"))
+
+    def test_async_logging_bounded_queue_drops(self):
+        """测试有界异步队列已满时丢弃记录而不阻塞"""
+        import queue
+
+        from src.db_connector_tool.utils.logging_utils import _DroppingQueueHandler
+
+        handler = _DroppingQueueHandler(queue.Queue(1))
+        record = logging.makeLogRecord({"msg": "消息"})
+        handler.enqueue(record)
+        handler.enqueue(record)
+        self.assertEqual(handler.queue.qsize(), 1)
+
+    def test_stop_queue_listener_with_full_queue(self):
+        """测试有界队列已满时停止监听线程不会抛出异常或遗留线程"""
+        import threading
+
+        from src.db_connector_tool.utils.logging_utils import (
+            _QUEUE_LISTENERS,
+            _enable_queue_logging,
+        )
+
+        release = threading.Event()
+        started = threading.Event()
+
+        class BlockingHandler(logging.Handler):
+            """处理第一条记录时阻塞，使队列保持已满状态"""
+
+            def emit(self, record):
+                started.set()
+                release.wait(5)
+
+        logger_name = self.app_name + "_full_queue"
+        logger = logging.getLogger(logger_name)
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(BlockingHandler())
+        _enable_queue_logging(logger, maxsize=1)
+
+        logger.info("第一条记录")
+        self.assertTrue(started.wait(5))
+        logger.info("第二条记录")
+        self.assertTrue(logger.handlers[0].queue.full())
+
+        thread = _QUEUE_LISTENERS[logger_name]._thread
+        threading.Timer(0.2, release.set).start()
+        _stop_queue_listener(logger_name)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(logger.handlers, [])
+
+    def test_buffered_rotating_file_handler(self):
+        """测试缓冲模式下低级别记录延迟写入，WARNING 及以上立即写出"""
+        from src.db_connector_tool.utils.logging_utils import (
+            BufferedRotatingFileHandler,
+        )
+
+        log_file = Path(self.temp_dir) / "buffered.log"
+        handler = BufferedRotatingFileHandler(
+            str(log_file),
+            maxBytes=1024 * 1024,
+            encoding="utf-8",
+            buffer_size=8192,
+            flush_interval=60,
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            handler.handle(
+                logging.makeLogRecord({"msg": "缓冲消息", "levelno": logging.INFO})
+            )
+            self.assertEqual(log_file.read_text(encoding="utf-8"), "")
+
+            handler.handle(
+                logging.makeLogRecord({"msg": "警告消息", "levelno": logging.WARNING})
+            )
+            self.assertEqual(
+                log_file.read_text(encoding="utf-8"), "缓冲消息\n警告消息\n"
+            )
+        finally:
+            handler.close()
+
+    def test_buffered_rotating_file_handler_flushes_when_idle(self):
+        """测试缓冲模式下没有新记录时，延迟的记录也会在 flush_interval 后写出"""
+        from src.db_connector_tool.utils.logging_utils import (
+            BufferedRotatingFileHandler,
+        )
+
+        log_file = Path(self.temp_dir) / "idle.log"
+        handler = BufferedRotatingFileHandler(
+            str(log_file),
+            encoding="utf-8",
+            buffer_size=8192,
+            flush_interval=0.05,
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            handler.handle(
+                logging.makeLogRecord({"msg": "空闲消息", "levelno": logging.INFO})
+            )
+            self.assertEqual(log_file.read_text(encoding="utf-8"), "")
+
+            deadline = time.monotonic() + 5
+            while not log_file.read_text(encoding="utf-8"):
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+            self.assertEqual(log_file.read_text(encoding="utf-8"), "空闲消息\n")
+        finally:
+            handler.close()
+
+    def test_buffered_rotating_file_handler_rollover(self):
+        """测试按大小轮转仍然生效，且轮转检查不再逐条检查文件类型"""
+        from unittest import mock
+
+        from src.db_connector_tool.utils.logging_utils import (
+            BufferedRotatingFileHandler,
+        )
+
+        log_file = Path(self.temp_dir) / "rotate.log"
+        handler = BufferedRotatingFileHandler(
+            str(log_file), maxBytes=100, backupCount=1, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        record = logging.makeLogRecord({"msg": "x" * 30, "levelno": logging.INFO})
+        try:
+            with mock.patch("os.path.isfile") as mock_isfile:
+                with mock.patch.object(handler, "format", wraps=handler.format) as fmt:
+                    for _ in range(5):
+                        handler.handle(record)
+            mock_isfile.assert_not_called()
+            self.assertEqual(fmt.call_count, 5)
+        finally:
+            handler.close()
+
+        self.assertTrue(Path(f"{log_file}.1").exists())
+        self.assertLess(log_file.stat().st_size, 100 + 31)
+
+    def test_log_manager_cleanup_stops_async_listener(self):
+        """测试LogManager清理时停止异步日志监听线程"""
+        log_manager = LogManager(self.app_name + "_async_manager")
+        logger = log_manager.setup(
+            log_dir=self.temp_dir, async_logging=True, queue_maxsize=100
+        )
+        logger.warning("清理前的消息")
+        log_manager.cleanup()
+        self.assertEqual(logger.handlers, [])
+
+        log_file = Path(self.temp_dir) / f"{self.app_name}_async_manager.log"
+        self.assertIn("清理前的消息", log_file.read_text(encoding="utf-8"))
+
     def test_log_manager_add_timed_file_handler(self):
         """测试LogManager添加基于时间轮转的文件handler"""
         log_manager = LogManager(self.app_name)
@@ -196,8 +399,14 @@ class TestLoggingUtils(unittest.TestCase):
     def test_log_manager_get_loggers_info(self):
         """测试LogManager获取logger信息"""
         log_manager = LogManager(self.app_name)
+        get_logger("placeholder_parent.child").setLevel(logging.WARNING)
         info = log_manager.get_loggers_info()
         self.assertIsInstance(info, dict)
+        self.assertEqual(info["placeholder_parent.child"]["level"], "WARNING")
+        self.assertNotIn("placeholder_parent", info)
+        self.assertIsInstance(
+            logging.root.manager.loggerDict["placeholder_parent"], logging.PlaceHolder
+        )
 
     def test_log_manager_quick_setup(self):
         """测试LogManager快速设置"""
@@ -121,6 +121,25 @@ class TestPathHelper(unittest.TestCase):
         with self.assertRaises(ValueError):
             PathHelper.get_absolute_path("", self.temp_dir)
 
+    @unittest.skipUnless(hasattr(os, "symlink"), "需要符号链接支持")
+    def test_get_absolute_path_symlinks(self):
+        """测试默认不解析符号链接，resolve_symlinks=True 时解析"""
+        target_dir = Path(self.temp_dir) / "target"
+        target_dir.mkdir()
+        link_dir = Path(self.temp_dir) / "link"
+        try:
+            link_dir.symlink_to(target_dir, target_is_directory=True)
+        except OSError:
+            self.skipTest("无法创建符号链接")
+
+        abs_path = PathHelper.get_absolute_path("link/../link/file.txt", self.temp_dir)
+        self.assertEqual(abs_path, link_dir / "file.txt")
+
+        resolved = PathHelper.get_absolute_path(
+            "link/file.txt", self.temp_dir, resolve_symlinks=True
+        )
+        self.assertEqual(resolved, target_dir.resolve() / "file.txt")
+
     def test_safe_join(self):
         """测试安全路径连接"""
         # 测试正常路径连接
@@ -154,6 +173,8 @@ class TestPathHelper(unittest.TestCase):
         self.assertFalse(
             PathHelper._is_valid_path_windows("C:\\invalid\\path\\file*.txt")
         )
+        self.assertFalse(PathHelper._is_valid_path_windows("C:\\tab\there"))
+        self.assertFalse(PathHelper._is_valid_path_windows("dir\\a:b"))
 
     def test_is_valid_path_unix(self):
         """测试Unix路径有效性检查"""
@@ -165,29 +186,78 @@ class TestPathHelper(unittest.TestCase):
         self.assertFalse(PathHelper._is_valid_path_unix("/invalid/path/file?.txt"))
         self.assertFalse(PathHelper._is_valid_path_unix("/invalid/path/file*.txt"))
 
-    @mock.patch("src.db_connector_tool.utils.path_utils.platform.system")
-    def test_get_user_config_dir_windows(self, mock_system):
+    @mock.patch("src.db_connector_tool.utils.path_utils._IS_WINDOWS", True)
+    def test_get_user_config_dir_windows(self):
         """测试Windows系统下获取配置目录"""
-        mock_system.return_value = "Windows"
         with mock.patch.dict(os.environ, {"APPDATA": self.temp_dir}):
             config_dir = PathHelper.get_user_config_dir(self.app_name)
             self.assertIsInstance(config_dir, Path)
             self.assertTrue(str(config_dir).startswith(self.temp_dir))
 
-    @mock.patch("src.db_connector_tool.utils.path_utils.platform.system")
-    def test_get_user_config_dir_macos(self, mock_system):
+    @mock.patch("src.db_connector_tool.utils.path_utils._IS_WINDOWS", False)
+    @mock.patch("src.db_connector_tool.utils.path_utils._IS_DARWIN", True)
+    def test_get_user_config_dir_macos(self):
         """测试macOS系统下获取配置目录"""
-        mock_system.return_value = "Darwin"
         config_dir = PathHelper.get_user_config_dir(self.app_name)
         self.assertIsInstance(config_dir, Path)
 
-    @mock.patch("src.db_connector_tool.utils.path_utils.platform.system")
-    def test_get_user_config_dir_fallback_failure(self, mock_system):
+    @mock.patch("src.db_connector_tool.utils.path_utils._IS_WINDOWS", False)
+    @mock.patch("src.db_connector_tool.utils.path_utils._IS_DARWIN", False)
+    def test_get_user_config_dir_xdg(self):
+        """测试Linux系统下优先使用XDG_CONFIG_HOME"""
+        home_dir = Path(self.temp_dir) / "home"
+        with mock.patch.object(Path, "home", return_value=home_dir):
+            with mock.patch.dict(os.environ, {"XDG_CONFIG_HOME": self.temp_dir}):
+                config_dir = PathHelper.get_user_config_dir(self.app_name)
+        self.assertEqual(config_dir, Path(self.temp_dir) / self.app_name)
+
+    @mock.patch("src.db_connector_tool.utils.path_utils._IS_WINDOWS", False)
+    @mock.patch("src.db_connector_tool.utils.path_utils._IS_DARWIN", False)
+    def test_get_user_config_dir_xdg_keeps_legacy_dir(self):
+        """测试XDG目录下无配置而旧的~/.config目录已存在时继续使用旧目录"""
+        home_dir = Path(self.temp_dir) / "home"
+        legacy_dir = home_dir / ".config" / self.app_name
+        legacy_dir.mkdir(parents=True)
+        xdg_dir = Path(self.temp_dir) / "xdg"
+
+        with mock.patch.object(Path, "home", return_value=home_dir):
+            with mock.patch.dict(os.environ, {"XDG_CONFIG_HOME": str(xdg_dir)}):
+                config_dir = PathHelper.get_user_config_dir(self.app_name)
+                self.assertEqual(config_dir, legacy_dir)
+                self.assertFalse((xdg_dir / self.app_name).exists())
+
+                (xdg_dir / self.app_name).mkdir(parents=True)
+                config_dir = PathHelper.get_user_config_dir(self.app_name)
+                self.assertEqual(config_dir, xdg_dir / self.app_name)
+
+    @mock.patch("src.db_connector_tool.utils.path_utils._IS_WINDOWS", False)
+    @mock.patch("src.db_connector_tool.utils.path_utils._IS_DARWIN", False)
+    def test_get_user_config_dir_fallback_failure(self):
         """测试获取配置目录回退也失败的情况"""
-        mock_system.return_value = "Linux"
         with mock.patch.object(Path, "mkdir", side_effect=OSError("Permission denied")):
-            with self.assertRaises(OSError):
-                PathHelper.get_user_config_dir(self.app_name)
+            with mock.patch.object(Path, "is_dir", return_value=False):
+                with self.assertRaises(OSError):
+                    PathHelper.get_user_config_dir(self.app_name)
+
+    def test_get_user_config_dir_existing_skips_mkdir(self):
+        """测试配置目录已存在时不再调用mkdir"""
+        PathHelper.get_user_config_dir(self.app_name)
+        with mock.patch.object(Path, "mkdir") as mock_mkdir:
+            config_dir = PathHelper.get_user_config_dir(self.app_name)
+        mock_mkdir.assert_not_called()
+        self.assertTrue(config_dir.is_dir())
+
+    @mock.patch("src.db_connector_tool.utils.path_utils._IS_WINDOWS", False)
+    @mock.patch("src.db_connector_tool.utils.path_utils._IS_DARWIN", False)
+    def test_get_user_config_dir_file_conflict_falls_back(self):
+        """测试配置路径被普通文件占用时回退到当前目录"""
+        Path(self.temp_dir, self.app_name).write_text("not a dir")
+        cwd = Path(self.temp_dir, "cwd")
+        cwd.mkdir()
+        with mock.patch.dict(os.environ, {"XDG_CONFIG_HOME": self.temp_dir}):
+            with mock.patch.object(Path, "cwd", return_value=cwd):
+                config_dir = PathHelper.get_user_config_dir(self.app_name)
+        self.assertEqual(config_dir, cwd / f".{self.app_name}")
 
     def test_ensure_dir_exists_file_conflict(self):
         """测试ensure_dir_exists当路径已存在但不是目录的情况"""
@@ -240,10 +310,9 @@ class TestPathHelper(unittest.TestCase):
         """测试is_valid_path处理只包含空白字符的路径"""
         self.assertFalse(PathHelper.is_valid_path("   "))
 
-    @mock.patch("src.db_connector_tool.utils.path_utils.platform.system")
-    def test_is_valid_path_windows_system(self, mock_system):
+    @mock.patch("src.db_connector_tool.utils.path_utils._IS_WINDOWS", True)
+    def test_is_valid_path_windows_system(self):
         """测试在Windows系统下调用is_valid_path"""
-        mock_system.return_value = "Windows"
         self.assertTrue(PathHelper.is_valid_path("C:\\valid\\path"))
         self.assertFalse(PathHelper.is_valid_path("C:\\invalid\\path\\file?.txt"))
 
@@ -256,7 +325,30 @@ class TestPathHelper(unittest.TestCase):
         """测试get_absolute_path处理OSError"""
         mock_resolve.side_effect = OSError("Permission denied")
         with self.assertRaises(OSError):
-            PathHelper.get_absolute_path("test", self.temp_dir)
+            PathHelper.get_absolute_path("test", self.temp_dir, resolve_symlinks=True)
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "需要符号链接支持")
+    def test_normalize_path_cache(self):
+        """测试绝对路径解析结果被缓存，clear_path_cache 后重新解析"""
+        first_dir = Path(self.temp_dir) / "first"
+        second_dir = Path(self.temp_dir) / "second"
+        first_dir.mkdir()
+        second_dir.mkdir()
+        link_dir = Path(self.temp_dir) / "link"
+        try:
+            link_dir.symlink_to(first_dir, target_is_directory=True)
+        except OSError:
+            self.skipTest("无法创建符号链接")
+        self.addCleanup(PathHelper.clear_path_cache)
+
+        self.assertEqual(PathHelper.normalize_path(link_dir), first_dir.resolve())
+
+        link_dir.unlink()
+        link_dir.symlink_to(second_dir, target_is_directory=True)
+        self.assertEqual(PathHelper.normalize_path(link_dir), first_dir.resolve())
+
+        PathHelper.clear_path_cache()
+        self.assertEqual(PathHelper.normalize_path(link_dir), second_dir.resolve())
 
     def test_safe_join_skip_empty_and_dot(self):
         """测试safe_join跳过空路径和点路径"""
@@ -264,12 +356,26 @@ class TestPathHelper(unittest.TestCase):
         self.assertIsInstance(safe_path, Path)
         self.assertTrue(str(safe_path).endswith("subdir"))
 
+    def test_safe_join_without_parts(self):
+        """测试safe_join没有路径部分时直接返回解析后的基础路径"""
+        expected = Path(self.temp_dir).resolve()
+        self.assertEqual(PathHelper.safe_join(self.temp_dir), expected)
+        self.assertEqual(PathHelper.safe_join(self.temp_dir, "", "."), expected)
+
     def test_safe_join_invalid_characters(self):
         """测试safe_join处理包含非法字符的路径部分"""
         with self.assertRaises(ValueError) as cm:
             PathHelper.safe_join(self.temp_dir, "file?.txt")
         self.assertIn("路径部分包含非法字符", str(cm.exception))
 
+        with self.assertRaises(ValueError) as cm:
+            PathHelper.safe_join(self.temp_dir, "subdir\\file.txt")
+        self.assertIn("路径部分包含路径分隔符", str(cm.exception))
+
+        with self.assertRaises(ValueError) as cm:
+            PathHelper.safe_join(self.temp_dir, "   ")
+        self.assertIn("路径部分包含非法字符", str(cm.exception))
+
     @mock.patch.object(Path, "resolve")
     def test_safe_join_final_check_failure(self, mock_resolve):
         """测试safe_join最终安全检查失败的情况"""
@@ -314,11 +420,10 @@ class TestPathHelper(unittest.TestCase):
         with self.assertRaises(OSError):
             PathHelper.set_secure_file_permissions(non_existent_file)
 
-    @mock.patch("src.db_connector_tool.utils.path_utils.platform.system")
+    @mock.patch("src.db_connector_tool.utils.path_utils._IS_WINDOWS", True)
     @mock.patch("src.db_connector_tool.utils.path_utils.subprocess.run")
-    def test_set_windows_permissions(self, mock_run, mock_system):
+    def test_set_windows_permissions(self, mock_run):
         """测试Windows系统权限设置"""
-        mock_system.return_value = "Windows"
         mock_run.return_value.returncode = 0
 
         test_file = Path(self.temp_dir) / "test_file.txt"
@@ -333,10 +438,9 @@ class TestPathHelper(unittest.TestCase):
         result = PathHelper._set_windows_file_permissions(test_file)
         self.assertFalse(result)
 
-    @mock.patch("src.db_connector_tool.utils.path_utils.platform.system")
-    def test_set_unix_permissions(self, mock_system):
+    @mock.patch("src.db_connector_tool.utils.path_utils._IS_WINDOWS", False)
+    def test_set_unix_permissions(self):
         """测试Unix系统权限设置"""
-        mock_system.return_value = "Linux"
 
         test_file = Path(self.temp_dir) / "test_file.txt"
         test_file.write_text("test content")